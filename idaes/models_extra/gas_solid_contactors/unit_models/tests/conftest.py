@@ -0,0 +1,57 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2026 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Shared fixtures for the gas-solid contactor unit model tests.
+"""
+
+import pytest
+
+from pyomo.environ import ConcreteModel
+
+from idaes.core import FlowsheetBlock
+
+
+@pytest.fixture(scope="session")
+def property_packages():
+    """Steady-state flowsheet with the methane iron OC property and reaction
+    parameter blocks prebuilt.
+
+    Parsing the thermo data and building the parameter blocks is repeated
+    work for every model fixture in this directory, so it is done once per
+    session here. Consumers must clone the returned model before attaching
+    unit models to it.
+
+    The property-package imports happen inside the fixture so that test
+    collection does not pay for loading them.
+    """
+    from idaes.models_extra.gas_solid_contactors.properties.methane_iron_OC_reduction.gas_phase_thermo import (
+        GasPhaseParameterBlock,
+    )
+    from idaes.models_extra.gas_solid_contactors.properties.methane_iron_OC_reduction.solid_phase_thermo import (
+        SolidPhaseParameterBlock,
+    )
+    from idaes.models_extra.gas_solid_contactors.properties.methane_iron_OC_reduction.hetero_reactions import (
+        HeteroReactionParameterBlock,
+    )
+
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+
+    m.fs.gas_properties = GasPhaseParameterBlock()
+    m.fs.solid_properties = SolidPhaseParameterBlock()
+    m.fs.hetero_reactions = HeteroReactionParameterBlock(
+        solid_property_package=m.fs.solid_properties,
+        gas_property_package=m.fs.gas_properties,
+    )
+
+    return m